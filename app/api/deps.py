@@ -0,0 +1,25 @@
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domain.ports.producto_repo_port import ProductoRepoPort
+from app.infrastructure.db.database import get_session
+from app.infrastructure.repositories.producto_repo_sql import ProductoRepoSQL
+
+
+def get_producto_repo(
+    session: AsyncSession = Depends(get_session)
+) -> ProductoRepoPort:
+    """
+    Provee el repositorio de productos a los endpoints.
+
+    INYECCIÓN DE DEPENDENCIAS:
+    - Los endpoints reciben el puerto (ProductoRepoPort)
+    - La implementación concreta (ProductoRepoSQL) se elige aquí
+    - Cada request usa su propia sesión de BD
+
+    Ejemplo:
+        @router.get("/")
+        async def listar(repo: ProductoRepoPort = Depends(get_producto_repo)):
+            return await ConsultarInventarioUseCase(repo).ejecutar()
+    """
+    return ProductoRepoSQL(session)
@@ -1,31 +1,66 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
+from typing import Literal
+
+__all__ = ["ProductoCreateDTO", "ProductoUpdateDTO", "ProductoResponseDTO"]
+
+# Ejemplos de Swagger: se construyen una sola vez al importar el módulo
+_EJEMPLO_CREAR = {
+    "sku": "RON001",
+    "nombre": "Ron Viejo de Caldas 8 Años",
+    "tipo_licor": "Ron",
+    "presentacion": "Botella 750ml",
+    "proveedor": "Licores Nacionales S.A.",
+    "precio_compra": 45000.00,
+    "precio_venta": 65000.00,
+    "stock": 100
+}
+
+_EJEMPLO_ACTUALIZAR = {
+    "precio_venta": 70000.00,
+    "stock": 150
+}
+
+_EJEMPLO_RESPUESTA = {
+    "id": 1,
+    "sku": "RON001",
+    "nombre": "Ron Viejo de Caldas 8 Años",
+    "tipo_licor": "Ron",
+    "presentacion": "Botella 750ml",
+    "proveedor": "Licores Nacionales S.A.",
+    "precio_compra": 45000.00,
+    "precio_venta": 65000.00,
+    "stock": 100,
+    "estado": "Activo",
+    "fecha_creacion": "2025-10-30T10:00:00",
+    "fecha_actualizacion": "2025-10-30T10:00:00"
+}
 
 
 class ProductoCreateDTO(BaseModel):
     """
     DTO (Data Transfer Object) para crear un producto (RF1).
 
-    QU ES UN DTO?
+    ¿QUÉ ES UN DTO?
     - Objeto simple para transferir datos entre capas
-    - No tiene lgica de negocio (eso est en la Entidad)
-    - Usa Pydantic para validacin automtica
+    - No tiene lógica de negocio (eso está en la Entidad)
+    - Usa Pydantic para validación automática
 
-    POR QU USAMOS DTOs?
-    1. SEPARACIN DE RESPONSABILIDADES:
-       - La Entidad tiene lgica de negocio
+    ¿POR QUÉ USAMOS DTOs?
+    1. SEPARACIÓN DE RESPONSABILIDADES:
+       - La Entidad tiene lógica de negocio
        - El DTO solo valida formato de datos de entrada
 
-    2. VALIDACIN AUTOMTICA:
+    2. VALIDACIÓN AUTOMÁTICA:
        - Pydantic valida tipos, rangos, formatos
-       - Si algo est mal, lanza excepcin antes de llegar al dominio
+       - Si algo está mal, lanza excepción antes de llegar al dominio
 
-    3. DOCUMENTACIN AUTO-GENERADA:
+    3. DOCUMENTACIÓN AUTO-GENERADA:
        - FastAPI usa estos DTOs para generar Swagger/OpenAPI
-       - El frontend sabe exactamente qu enviar
+       - El frontend sabe exactamente qué enviar
 
-    RELACIN CON LA ARQUITECTURA:
-    - Pertenece a la capa de APLICACIN
+    RELACIÓN CON LA ARQUITECTURA:
+    - Pertenece a la capa de APLICACIÓN
     - Es el contrato entre la API y los casos de uso
     """
 
@@ -33,7 +68,7 @@ class ProductoCreateDTO(BaseModel):
         ...,
         min_length=1,
         max_length=50,
-        description="Cdigo SKU nico del producto"
+        description="Código SKU único del producto"
     )
 
     nombre: str = Field(
@@ -50,7 +85,7 @@ class ProductoCreateDTO(BaseModel):
 
     presentacion: str = Field(
         ...,
-        description="Presentacin del producto (Botella 750ml, Caja x6, etc.)"
+        description="Presentación del producto (Botella 750ml, Caja x6, etc.)"
     )
 
     proveedor: str = Field(
@@ -80,46 +115,36 @@ class ProductoCreateDTO(BaseModel):
     @classmethod
     def sku_sin_espacios(cls, v: str) -> str:
         """
-        Valida que el SKU no contenga espacios y lo convierte a maysculas.
+        Valida que el SKU no contenga espacios y lo convierte a mayúsculas.
 
         Args:
             v: Valor del SKU
 
         Returns:
-            SKU en maysculas y sin espacios
+            SKU en mayúsculas y sin espacios
 
         Raises:
             ValueError: Si el SKU contiene espacios
         """
+        # ' ' in v y str.upper() ya son rutas en C con camino rápido para
+        # texto ASCII (el caso normal de un SKU); traducir vía bytes no
+        # mejora y agrega dos copias (encode/decode).
         if ' ' in v:
             raise ValueError('El SKU no puede contener espacios')
         return v.upper()
 
-    class Config:
-        """
-        Configuracin de Pydantic.
-
-        json_schema_extra: Ejemplo que aparece en Swagger
-        """
-        json_schema_extra = {
-            "example": {
-                "sku": "RON001",
-                "nombre": "Ron Viejo de Caldas 8 Aos",
-                "tipo_licor": "Ron",
-                "presentacion": "Botella 750ml",
-                "proveedor": "Licores Nacionales S.A.",
-                "precio_compra": 45000.00,
-                "precio_venta": 65000.00,
-                "stock": 100
-            }
-        }
+    # Configuración de Pydantic.
+    # json_schema_extra: Ejemplo que aparece en Swagger
+    model_config = ConfigDict(
+        json_schema_extra={"example": _EJEMPLO_CREAR}
+    )
 
 
 class ProductoUpdateDTO(BaseModel):
     """
     DTO para actualizar un producto (RF2).
 
-    CARACTERSTICAS:
+    CARACTERÍSTICAS:
     - Todos los campos son opcionales (Optional)
     - Permite actualizaciones parciales
     - Solo se actualizan los campos enviados
@@ -138,29 +163,25 @@ class ProductoUpdateDTO(BaseModel):
     precio_compra: float | None = Field(None, gt=0)
     precio_venta: float | None = Field(None, gt=0)
     stock: int | None = Field(None, ge=0)
-    estado: str | None = Field(None, pattern="^(Activo|Inactivo)$")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "precio_venta": 70000.00,
-                "stock": 150
-            }
-        }
+    estado: Literal["Activo", "Inactivo"] | None = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": _EJEMPLO_ACTUALIZAR}
+    )
 
 
 class ProductoResponseDTO(BaseModel):
     """
     DTO para respuestas de la API.
 
-    PROPSITO:
-    - Define qu datos se envan al cliente
+    PROPÓSITO:
+    - Define qué datos se envían al cliente
     - Incluye datos calculados/generados (ID, fechas)
     - Se usa en las respuestas de todos los endpoints
 
     VENTAJAS:
-    - El cliente sabe exactamente qu esperar
-    - FastAPI genera documentacin automtica
+    - El cliente sabe exactamente qué esperar
+    - FastAPI genera documentación automática
     - Valida que la respuesta tenga el formato correcto
     """
 
@@ -177,25 +198,21 @@ class ProductoResponseDTO(BaseModel):
     fecha_creacion: datetime
     fecha_actualizacion: datetime
 
-    class Config:
-        """
-        from_attributes: Permite crear DTO desde objetos Python
-        (como las entidades del dominio)
-        """
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "sku": "RON001",
-                "nombre": "Ron Viejo de Caldas 8 Aos",
-                "tipo_licor": "Ron",
-                "presentacion": "Botella 750ml",
-                "proveedor": "Licores Nacionales S.A.",
-                "precio_compra": 45000.00,
-                "precio_venta": 65000.00,
-                "stock": 100,
-                "estado": "Activo",
-                "fecha_creacion": "2025-10-30T10:00:00",
-                "fecha_actualizacion": "2025-10-30T10:00:00"
-            }
-        }
+    # from_attributes: Permite crear DTO desde objetos Python
+    # (como las entidades del dominio)
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={"example": _EJEMPLO_RESPUESTA}
+    )
+
+
+# Precalentamiento: una validación y un volcado por DTO al importar el
+# módulo, para que el primer request no pague el arranque en frío de
+# pydantic-core. De paso, comprueba que los ejemplos de Swagger son válidos.
+for _dto, _ejemplo in (
+    (ProductoCreateDTO, _EJEMPLO_CREAR),
+    (ProductoUpdateDTO, _EJEMPLO_ACTUALIZAR),
+    (ProductoResponseDTO, _EJEMPLO_RESPUESTA),
+):
+    _dto.model_validate(_ejemplo).model_dump()
+del _dto, _ejemplo
@@ -1,4 +1,7 @@
-from app.domain.entities.producto import Producto
+from datetime import datetime
+
+from app.domain.entities.producto import ESTADO_ACTIVO, ESTADO_INACTIVO, Producto
+from app.domain.exceptions import ProductoNoEncontradoError
 from app.domain.ports.producto_repo_port import ProductoRepoPort
 
 
@@ -9,12 +12,12 @@ class ActualizarProductoUseCase:
     RESPONSABILIDAD:
     - Permitir modificar los datos de un producto existente
     - Validar reglas de negocio antes de actualizar
-    - Mantener la trazabilidad (fecha de actualizacin)
+    - Mantener la trazabilidad (fecha de actualización)
 
     CAMPOS ACTUALIZABLES:
     - Nombre
     - Tipo de licor
-    - Presentacin
+    - Presentación
     - Proveedor
     - Precio de compra
     - Precio de venta
@@ -27,7 +30,7 @@ class ActualizarProductoUseCase:
 
     PRINCIPIOS SOLID:
     - S (SRP): Solo actualiza productos
-    - D (DIP): Depende de abstraccin (ProductoRepoPort)
+    - D (DIP): Depende de abstracción (ProductoRepoPort)
     """
 
     def __init__(self, repo: ProductoRepoPort):
@@ -36,10 +39,16 @@ class ActualizarProductoUseCase:
 
         Args:
             repo: Repositorio de productos
+
+        ATRIBUTOS:
+        - persistio: True si la última ejecución escribió en el repositorio
+          (False en una actualización sin cambios). Permite al llamador
+          invalidar cachés solo cuando algo cambió.
         """
         self.repo = repo
+        self.persistio = False
 
-    def ejecutar(
+    async def ejecutar(
         self,
         id: int,
         nombre: str | None = None,
@@ -52,20 +61,22 @@ class ActualizarProductoUseCase:
         estado: str | None = None
     ) -> Producto:
         """
-        Ejecuta la actualizacin de un producto.
+        Ejecuta la actualización de un producto.
 
         FLUJO:
         1. Buscar producto existente por ID
-        2. Actualizar solo los campos que vienen con valor
-        3. Validar reglas de negocio (stock, precios)
-        4. Guardar cambios
-        5. Retornar producto actualizado
+        2. Detectar qué campos cambian realmente
+           (si ninguno cambia, se retorna el producto sin escribir en BD)
+        3. Actualizar solo esos campos
+        4. Validar reglas de negocio (stock, precios)
+        5. Guardar cambios
+        6. Retornar producto actualizado
 
         Args:
             id: ID del producto a actualizar
             nombre: Nuevo nombre (opcional)
             tipo_licor: Nuevo tipo de licor (opcional)
-            presentacion: Nueva presentacin (opcional)
+            presentacion: Nueva presentación (opcional)
             proveedor: Nuevo proveedor (opcional)
             precio_compra: Nuevo precio de compra (opcional)
             precio_venta: Nuevo precio de venta (opcional)
@@ -76,43 +87,65 @@ class ActualizarProductoUseCase:
             Producto actualizado
 
         Raises:
-            ValueError: Si el producto no existe
+            ProductoNoEncontradoError: Si el producto no existe
             ValueError: Si el stock es negativo
-            ValueError: Si los precios no son vlidos
+            ValueError: Si los precios no son válidos
 
         Ejemplo:
-            producto = caso_uso.ejecutar(
+            producto = await caso_uso.ejecutar(
                 id=1,
                 precio_venta=70000,
                 stock=150
             )
         """
-        producto = self.repo.buscar_por_id(id)
+        self.persistio = False
+        producto = await self.repo.buscar_por_id(id)
         if not producto:
-            raise ValueError(f"Producto con ID {id} no encontrado")
-
-        if nombre is not None:
-            producto.nombre = nombre
-        if tipo_licor is not None:
-            producto.tipo_licor = tipo_licor
-        if presentacion is not None:
-            producto.presentacion = presentacion
-        if proveedor is not None:
-            producto.proveedor = proveedor
-        if precio_compra is not None:
-            producto.precio_compra = precio_compra
-        if precio_venta is not None:
-            producto.precio_venta = precio_venta
-        if stock is not None:
-            producto.actualizar_stock(stock)
-        if estado is not None:
-            if estado == "Activo":
-                producto.activar()
-            elif estado == "Inactivo":
-                producto.desactivar()
-
-        producto.validar_precios()
-
-        producto_actualizado = self.repo.actualizar(producto)
+            raise ProductoNoEncontradoError(f"Producto con ID {id} no encontrado")
+
+        # Solo los campos que vienen con un valor distinto al actual
+        cambios = {
+            campo: valor
+            for campo, valor in (
+                ("nombre", nombre),
+                ("tipo_licor", tipo_licor),
+                ("presentacion", presentacion),
+                ("proveedor", proveedor),
+                ("precio_compra", precio_compra),
+                ("precio_venta", precio_venta),
+            )
+            if valor is not None and getattr(producto, campo) != valor
+        }
+        cambia_stock = stock is not None and stock != producto.stock
+        cambia_estado = estado is not None and estado != producto.estado
+
+        # Actualización sin cambios (p. ej. reintentos idempotentes):
+        # no se escribe en la BD ni se modifica la fecha de actualización
+        if not cambios and not cambia_stock and not cambia_estado:
+            return producto
+
+        # Una sola lectura del reloj para todos los campos modificados
+        ahora = datetime.now()
+
+        for campo, valor in cambios.items():
+            setattr(producto, campo, valor)
+        if cambios:
+            producto._touch(ahora)
+
+        # Stock y estado pasan por la entidad (RN2, RN5)
+        if cambia_stock:
+            producto.actualizar_stock(stock, ahora)
+        if cambia_estado:
+            if estado == ESTADO_ACTIVO:
+                producto.activar(ahora)
+            elif estado == ESTADO_INACTIVO:
+                producto.desactivar(ahora)
+
+        # Solo se revalidan los precios si alguno cambió
+        if "precio_compra" in cambios or "precio_venta" in cambios:
+            producto.validar_precios()
+
+        producto_actualizado = await self.repo.actualizar(producto)
+        self.persistio = True
 
         return producto_actualizado
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Hashable, MutableMapping, Sequence
 from app.domain.entities.producto import Producto
 from app.domain.ports.producto_repo_port import ProductoRepoPort
 
@@ -10,14 +10,14 @@ class ConsultarInventarioUseCase:
     RESPONSABILIDAD:
     - Proporcionar acceso a la lista completa de productos
     - Permitir consultar solo productos activos (opcional)
-    - Facilitar la visualizacin del estado del inventario
+    - Facilitar la visualización del estado del inventario
 
-    INFORMACIN RETORNADA:
+    INFORMACIÓN RETORNADA:
     - Todos los productos del inventario
     - Cantidad actual de stock
     - Estado (Activo/Inactivo)
-    - Fecha de ltima actualizacin
-    - Todos los dems datos del producto
+    - Fecha de última actualización
+    - Todos los demás datos del producto
 
     USO PRINCIPAL:
     - Dashboard de inventario (RF20)
@@ -26,69 +26,125 @@ class ConsultarInventarioUseCase:
 
     PRINCIPIOS SOLID:
     - S (SRP): Solo consulta inventario
-    - D (DIP): Depende de abstraccin (ProductoRepoPort)
+    - D (DIP): Depende de abstracción (ProductoRepoPort)
     """
 
-    def __init__(self, repo: ProductoRepoPort):
+    def __init__(
+        self,
+        repo: ProductoRepoPort,
+        cache: MutableMapping[Hashable, Sequence[Producto]] | None = None
+    ):
         """
         Constructor del caso de uso.
 
         Args:
             repo: Repositorio de productos
+            cache: Caché opcional de resultados (p. ej. un cachetools.TTLCache
+                   compartido por la API). ejecutar() la indexa por
+                   solo_activos y listar_pagina() por (limit, offset, estado)
         """
         self.repo = repo
+        self.cache = cache
 
-    def ejecutar(self, solo_activos: bool = False) -> List[Producto]:
+    async def ejecutar(self, solo_activos: bool = False) -> Sequence[Producto]:
         """
         Ejecuta la consulta del inventario.
 
         FLUJO:
-        1. Llamar al repositorio
-        2. Obtener lista de productos (todos o solo activos)
-        3. Retornar lista
+        1. Consultar la caché (si se inyectó una)
+        2. Si no hay resultado, llamar al repositorio
+        3. Retornar secuencia de solo lectura
 
         Args:
             solo_activos: Si True, retorna solo productos activos
 
         Returns:
-            Lista de productos del inventario
+            Secuencia (tupla) de productos del inventario. Puede ser un
+            resultado compartido: no debe modificarse.
 
         Ejemplo:
             # Consultar todos los productos
-            todos = caso_uso.ejecutar()
+            todos = await caso_uso.ejecutar()
 
             # Consultar solo activos
-            activos = caso_uso.ejecutar(solo_activos=True)
+            activos = await caso_uso.ejecutar(solo_activos=True)
         """
+        if self.cache is not None:
+            productos = self.cache.get(solo_activos)
+            if productos is not None:
+                return productos
+
         if solo_activos:
-            return self.repo.listar_activos()
+            productos = await self.repo.listar_activos()
         else:
-            return self.repo.listar_todos()
+            productos = await self.repo.listar_todos()
+
+        if self.cache is not None:
+            self.cache[solo_activos] = productos
+        return productos
+
+    async def listar_pagina(
+        self,
+        limit: int,
+        offset: int = 0,
+        estado: str | None = None
+    ) -> Sequence[Producto]:
+        """
+        Consulta una página del inventario, opcionalmente filtrada por estado.
+
+        FLUJO:
+        1. Consultar la caché con la clave (limit, offset, estado)
+        2. Si no hay resultado, pedir la página al repositorio
+        3. Retornar secuencia de solo lectura
+
+        Args:
+            limit: Cantidad máxima de productos
+            offset: Productos a saltar desde el inicio
+            estado: Filtrar por estado (opcional)
+
+        Returns:
+            Secuencia (tupla) de productos de la página. Puede ser un
+            resultado compartido: no debe modificarse.
+
+        Ejemplo:
+            pagina = await caso_uso.listar_pagina(limit=50, offset=100)
+        """
+        clave = (limit, offset, estado)
+        if self.cache is not None:
+            productos = self.cache.get(clave)
+            if productos is not None:
+                return productos
+
+        productos = await self.repo.listar_pagina(limit, offset, estado)
+
+        if self.cache is not None:
+            self.cache[clave] = productos
+        return productos
 
-    def buscar_por_sku(self, sku: str) -> Producto | None:
+    async def buscar_por_sku(self, sku: str) -> Producto | None:
         """
-        Busca un producto especfico por SKU.
+        Busca un producto específico por SKU.
 
         UTILIDAD:
-        - Bsqueda rpida de productos
-        - Validacin de existencia
+        - Búsqueda rápida de productos
+        - Validación de existencia
 
         Args:
-            sku: Cdigo SKU del producto
+            sku: Código SKU del producto
 
         Returns:
             Producto encontrado o None
 
         Ejemplo:
-            producto = caso_uso.buscar_por_sku("RON001")
+            producto = await caso_uso.buscar_por_sku("RON001")
             if producto:
                 print(f"Stock: {producto.stock}")
         """
-        return self.repo.buscar_por_sku(sku)
+        return await self.repo.buscar_por_sku(sku)
 
-    def buscar_por_id(self, id: int) -> Producto | None:
+    async def buscar_por_id(self, id: int) -> Producto | None:
         """
-        Busca un producto especfico por ID.
+        Busca un producto específico por ID.
 
         Args:
             id: ID del producto
@@ -97,6 +153,6 @@ class ConsultarInventarioUseCase:
             Producto encontrado o None
 
         Ejemplo:
-            producto = caso_uso.buscar_por_id(1)
+            producto = await caso_uso.buscar_por_id(1)
         """
-        return self.repo.buscar_por_id(id)
+        return await self.repo.buscar_por_id(id)
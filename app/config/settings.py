@@ -1,38 +1,65 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+__all__ = ["Settings", "get_settings"]
 
 
 class Settings(BaseSettings):
     """
-    Configuracin de la aplicacin.
+    Configuración de la aplicación.
 
     RESPONSABILIDAD:
-    - Centralizar todas las variables de configuracin
+    - Centralizar todas las variables de configuración
     - Leer variables de entorno desde .env
     - Proporcionar valores por defecto
 
     PRINCIPIOS APLICADOS:
-    - RA14: Gestin de configuracin externa
+    - RA14: Gestión de configuración externa
     - No hardcodear valores sensibles
     - Facilitar cambio entre entornos (dev, test, prod)
 
     VARIABLES:
-    - database_url: URL de conexin a la base de datos
-      * SQLite para desarrollo local
-      * PostgreSQL para produccin
+    - database_url: URL de conexión a la base de datos
+      * SQLite (aiosqlite) para desarrollo local
+      * PostgreSQL (asyncpg) para producción
+    - debug: Registra cada sentencia SQL en el log (solo desarrollo)
+    - db_pool_*: Pool de conexiones (solo motores cliente/servidor,
+      SQLite no usa estos valores)
+    - auto_create_tables: Crear las tablas al iniciar (desarrollo).
+      En producción AUTO_CREATE_TABLES=false y el esquema lo gestionan
+      las migraciones
     """
 
-    database_url: str = "sqlite:///inventarios.db"
+    database_url: str = "sqlite+aiosqlite:///inventarios.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
     app_name: str = "Inventarios LicoCastillo"
     app_version: str = "1.0.0"
+    debug: bool = False
+    auto_create_tables: bool = True
 
-    class Config:
-        """
-        Configuracin de Pydantic Settings.
+    # Configuración de Pydantic Settings.
+    # env_file: Lee variables desde archivo .env
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8"
+    )
 
-        env_file: Lee variables desde archivo .env
-        """
-        env_file = ".env"
-        env_file_encoding = "utf-8"
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Retorna la configuración de la aplicación.
 
-settings = Settings()
+    - Se construye en el primer uso, no al importar el módulo
+    - lru_cache garantiza una única instancia por proceso
+    - Puede inyectarse en FastAPI con Depends(get_settings)
+
+    Ejemplo:
+        settings = get_settings()
+        print(settings.database_url)
+    """
+    return Settings()
@@ -1,25 +1,48 @@
+import sys
 from datetime import datetime
 
+# Estados posibles de un producto (RN5). Internados para que las
+# comparaciones con valores leídos de la BD se resuelvan por identidad.
+ESTADO_ACTIVO = sys.intern("Activo")
+ESTADO_INACTIVO = sys.intern("Inactivo")
+
 
 class Producto:
     """
     Entidad del dominio que representa un producto del inventario.
 
     RESPONSABILIDADES:
-    - Mantener la identidad del producto (SKU nico)
+    - Mantener la identidad del producto (SKU único)
     - Validar reglas de negocio relacionadas con el producto
     - Encapsular los datos del producto
 
     REGLAS DE NEGOCIO APLICADAS:
-    - RN1: SKU debe ser nico (validado en el caso de uso)
+    - RN1: SKU debe ser único (validado en el caso de uso)
     - RN2: Stock no puede ser negativo
     - RN5: Productos inactivos no se pueden mover ni vender
 
     PRINCIPIOS SOLID:
-    - SRP: Esta clase solo se encarga de la lgica de negocio del Producto
+    - SRP: Esta clase solo se encarga de la lógica de negocio del Producto
     - OCP: Podemos extenderla sin modificarla
     """
 
+    # __slots__ evita el __dict__ por instancia: menos memoria al listar
+    # muchos productos y acceso a atributos más rápido.
+    __slots__ = (
+        "id",
+        "sku",
+        "nombre",
+        "tipo_licor",
+        "presentacion",
+        "proveedor",
+        "precio_compra",
+        "precio_venta",
+        "stock",
+        "estado",
+        "fecha_creacion",
+        "fecha_actualizacion",
+    )
+
     def __init__(
         self,
         sku: str,
@@ -30,7 +53,7 @@ class Producto:
         precio_compra: float,
         precio_venta: float,
         stock: int,
-        estado: str = "Activo",
+        estado: str = ESTADO_ACTIVO,
         id: int | None = None,
         fecha_creacion: datetime | None = None,
         fecha_actualizacion: datetime | None = None
@@ -39,18 +62,18 @@ class Producto:
         Constructor de la entidad Producto.
 
         Args:
-            sku: Cdigo SKU nico del producto
+            sku: Código SKU único del producto
             nombre: Nombre del producto
             tipo_licor: Tipo de licor (Ron, Whisky, Vodka, etc.)
-            presentacion: Presentacin del producto (Botella 750ml, etc.)
+            presentacion: Presentación del producto (Botella 750ml, etc.)
             proveedor: Nombre del proveedor
             precio_compra: Precio al que se compra el producto
             precio_venta: Precio al que se vende el producto
             stock: Cantidad disponible en inventario
             estado: Estado del producto (Activo/Inactivo)
             id: ID del producto (asignado por la BD)
-            fecha_creacion: Fecha de creacin del registro
-            fecha_actualizacion: Fecha de ltima actualizacin
+            fecha_creacion: Fecha de creación del registro
+            fecha_actualizacion: Fecha de última actualización
         """
         self.id = id
         self.sku = sku
@@ -61,15 +84,16 @@ class Producto:
         self.precio_compra = precio_compra
         self.precio_venta = precio_venta
         self.stock = stock
-        self.estado = estado
-        self.fecha_creacion = fecha_creacion or datetime.now()
-        self.fecha_actualizacion = fecha_actualizacion or datetime.now()
+        self.estado = sys.intern(estado)
+        ahora = None if fecha_creacion and fecha_actualizacion else datetime.now()
+        self.fecha_creacion = fecha_creacion or ahora
+        self.fecha_actualizacion = fecha_actualizacion or ahora
 
     def validar_stock_no_negativo(self) -> None:
         """
         Valida la regla de negocio RN2: Stock no negativo.
 
-        Esta validacin asegura que nunca tengamos stock negativo,
+        Esta validación asegura que nunca tengamos stock negativo,
         lo cual no tiene sentido en el mundo real.
 
         Raises:
@@ -89,7 +113,7 @@ class Producto:
         Los precios deben ser positivos para tener sentido comercial.
 
         Raises:
-            ValueError: Si algn precio es invlido
+            ValueError: Si algún precio es inválido
 
         Ejemplo:
             producto.precio_compra = 0
@@ -101,7 +125,18 @@ class Producto:
         if self.precio_venta <= 0:
             raise ValueError("El precio de venta debe ser mayor a 0")
 
-    def desactivar(self) -> None:
+    def _touch(self, now: datetime | None = None) -> None:
+        """
+        Registra la fecha de última actualización.
+
+        Args:
+            now: Momento de la modificación. Si no se indica, se usa
+                 datetime.now(). Permite que varias modificaciones de una
+                 misma operación compartan una sola lectura del reloj.
+        """
+        self.fecha_actualizacion = now or datetime.now()
+
+    def desactivar(self, now: datetime | None = None) -> None:
         """
         Cambia el estado del producto a Inactivo (RN5).
 
@@ -109,35 +144,46 @@ class Producto:
         Se usa en lugar de eliminar el producto para mantener
         el historial y la trazabilidad.
 
+        Args:
+            now: Momento de la modificación (opcional)
+
         Ejemplo:
             producto.desactivar()
             print(producto.estado)  # "Inactivo"
         """
-        self.estado = "Inactivo"
-        self.fecha_actualizacion = datetime.now()
+        self.estado = ESTADO_INACTIVO
+        self._touch(now)
 
-    def activar(self) -> None:
+    def activar(self, now: datetime | None = None) -> None:
         """
         Cambia el estado del producto a Activo.
 
         Reactiva un producto previamente desactivado.
 
+        Args:
+            now: Momento de la modificación (opcional)
+
         Ejemplo:
             producto.activar()
             print(producto.estado)  # "Activo"
         """
-        self.estado = "Activo"
-        self.fecha_actualizacion = datetime.now()
+        self.estado = ESTADO_ACTIVO
+        self._touch(now)
 
-    def actualizar_stock(self, nueva_cantidad: int) -> None:
+    def actualizar_stock(
+        self,
+        nueva_cantidad: int,
+        now: datetime | None = None
+    ) -> None:
         """
         Actualiza el stock validando que no sea negativo.
 
-        Este mtodo encapsula la lgica de actualizacin de stock
+        Este método encapsula la lógica de actualización de stock
         garantizando que se cumpla la regla RN2.
 
         Args:
             nueva_cantidad: Nueva cantidad de stock
+            now: Momento de la modificación (opcional)
 
         Raises:
             ValueError: Si la cantidad es negativa
@@ -146,29 +192,30 @@ class Producto:
             producto.actualizar_stock(50)
             print(producto.stock)  # 50
         """
+        if nueva_cantidad < 0:
+            raise ValueError("El stock no puede ser negativo (RN2)")
         self.stock = nueva_cantidad
-        self.validar_stock_no_negativo()
-        self.fecha_actualizacion = datetime.now()
+        self._touch(now)
 
     def esta_activo(self) -> bool:
         """
-        Verifica si el producto est activo.
+        Verifica si el producto está activo.
 
         Returns:
-            True si el producto est activo, False en caso contrario
+            True si el producto está activo, False en caso contrario
 
         Ejemplo:
             if producto.esta_activo():
                 print("Puede venderse")
         """
-        return self.estado == "Activo"
+        return self.estado == ESTADO_ACTIVO
 
     def __repr__(self) -> str:
         """
-        Representacin en string del producto (til para debugging).
+        Representación en string del producto (útil para debugging).
 
         Returns:
-            String con la representacin del producto
+            String con la representación del producto
 
         Ejemplo:
             print(producto)  # Producto(SKU: RON001, Nombre: Ron Viejo...)
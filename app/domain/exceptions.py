@@ -0,0 +1,37 @@
+__all__ = ["ProductoNoEncontradoError", "SkuDuplicadoError"]
+
+
+class SkuDuplicadoError(ValueError):
+    """
+    Error de dominio: el SKU ya está registrado (RN1).
+
+    PERTENECE A: Capa de Dominio
+
+    ¿POR QUÉ UNA EXCEPCIÓN PROPIA?
+    - Los puertos y casos de uso lanzan ValueError para toda regla violada
+    - La API necesita distinguir el SKU duplicado (409 Conflict) de un
+      dato inválido (400 Bad Request)
+    - Hereda de ValueError: el código que ya captura ValueError sigue
+      funcionando igual
+
+    Ejemplo:
+        try:
+            await repo.guardar(producto)
+        except SkuDuplicadoError:
+            print("El SKU ya existe")
+    """
+
+
+class ProductoNoEncontradoError(ValueError):
+    """
+    Error de dominio: no existe un producto con el ID indicado.
+
+    Permite a la API responder 404 Not Found en lugar de 400. Hereda de
+    ValueError por la misma razón que SkuDuplicadoError.
+
+    Ejemplo:
+        try:
+            await caso_uso.ejecutar(id=99, stock=10)
+        except ProductoNoEncontradoError:
+            print("El producto no existe")
+    """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Sequence
 from app.domain.entities.producto import Producto
 
 
@@ -9,41 +9,41 @@ class ProductoRepoPort(ABC):
 
     Este es un PUERTO SECUNDARIO (salida) de la arquitectura hexagonal.
 
-    QU ES UN PUERTO?
+    ¿QUÉ ES UN PUERTO?
     - Es una interfaz (contrato) que define operaciones
-    - Define QU se necesita hacer, NO CMO hacerlo
+    - Define QUÉ se necesita hacer, NO CÓMO hacerlo
     - Pertenece a la capa de DOMINIO
 
-    POR QU USAMOS PUERTOS?
-    1. INVERSIN DE DEPENDENCIAS (SOLID - Principio D):
+    ¿POR QUÉ USAMOS PUERTOS?
+    1. INVERSIÓN DE DEPENDENCIAS (SOLID - Principio D):
        - El dominio define lo que necesita
        - La infraestructura lo implementa
        - El dominio NO depende de la infraestructura
 
     2. FLEXIBILIDAD:
-       - Podemos tener mltiples implementaciones:
+       - Podemos tener múltiples implementaciones:
          * ProductoRepoSQL (SQLite/PostgreSQL)
          * ProductoRepoMongo (MongoDB)
          * ProductoRepoMemory (para pruebas)
        - Cambiar de BD no afecta al dominio
 
     3. TESTABILIDAD:
-       - Podemos crear mocks fcilmente
+       - Podemos crear mocks fácilmente
        - No necesitamos BD real para probar el dominio
 
-    RELACIN CON EL PATRN ADAPTER:
+    RELACIÓN CON EL PATRÓN ADAPTER:
     - Este puerto es la interfaz que los adaptadores deben implementar
-    - Los adaptadores "adaptan" tecnologas externas a este contrato
+    - Los adaptadores "adaptan" tecnologías externas a este contrato
     """
 
     @abstractmethod
-    def guardar(self, producto: Producto) -> Producto:
+    async def guardar(self, producto: Producto) -> Producto:
         """
         Guarda un producto nuevo en el repositorio.
 
         RESPONSABILIDAD:
         - Persistir un producto nuevo
-        - Asignar un ID nico
+        - Asignar un ID único
         - Validar que el SKU no exista (RN1)
 
         Args:
@@ -53,23 +53,48 @@ class ProductoRepoPort(ABC):
             Producto guardado con su ID asignado
 
         Raises:
-            ValueError: Si el SKU ya existe (RN1)
+            SkuDuplicadoError: Si el SKU ya existe (RN1)
 
         Ejemplo:
             producto = Producto(sku="RON001", ...)
-            producto_guardado = repo.guardar(producto)
+            producto_guardado = await repo.guardar(producto)
             print(producto_guardado.id)  # 1
         """
         pass
 
     @abstractmethod
-    def actualizar(self, producto: Producto) -> Producto:
+    async def guardar_muchos(self, productos: Sequence[Producto]) -> Sequence[Producto]:
+        """
+        Guarda varios productos nuevos en una sola operación.
+
+        RESPONSABILIDAD:
+        - Persistir un lote completo (cargas iniciales, importaciones)
+        - Validar RN1 para todo el lote de una vez
+        - Todo o nada: si un SKU falla, no se guarda ningún producto
+
+        Args:
+            productos: Entidades Producto a guardar
+
+        Returns:
+            Productos guardados con su ID asignado, en el mismo orden
+
+        Raises:
+            SkuDuplicadoError: Si algún SKU ya existe o se repite en el lote (RN1)
+
+        Ejemplo:
+            guardados = await repo.guardar_muchos([producto1, producto2])
+            print([p.id for p in guardados])  # [1, 2]
+        """
+        pass
+
+    @abstractmethod
+    async def actualizar(self, producto: Producto) -> Producto:
         """
         Actualiza un producto existente.
 
         RESPONSABILIDAD:
         - Modificar los datos de un producto existente
-        - Actualizar la fecha de modificacin
+        - Actualizar la fecha de modificación
 
         Args:
             producto: Entidad Producto con los datos actualizados
@@ -78,16 +103,16 @@ class ProductoRepoPort(ABC):
             Producto actualizado
 
         Raises:
-            ValueError: Si el producto no existe
+            ProductoNoEncontradoError: Si el producto no existe
 
         Ejemplo:
             producto.precio_venta = 70000
-            repo.actualizar(producto)
+            await repo.actualizar(producto)
         """
         pass
 
     @abstractmethod
-    def buscar_por_id(self, id: int) -> Producto | None:
+    async def buscar_por_id(self, id: int) -> Producto | None:
         """
         Busca un producto por su ID.
 
@@ -98,55 +123,81 @@ class ProductoRepoPort(ABC):
             Producto encontrado o None si no existe
 
         Ejemplo:
-            producto = repo.buscar_por_id(1)
+            producto = await repo.buscar_por_id(1)
             if producto:
                 print(producto.nombre)
         """
         pass
 
     @abstractmethod
-    def buscar_por_sku(self, sku: str) -> Producto | None:
+    async def buscar_por_sku(self, sku: str) -> Producto | None:
         """
         Busca un producto por su SKU.
 
         IMPORTANCIA:
-        - Usado para validar RN1 (SKU nico)
+        - Usado para validar RN1 (SKU único)
         - Evita duplicados en el inventario
 
         Args:
-            sku: Cdigo SKU del producto
+            sku: Código SKU del producto
 
         Returns:
             Producto encontrado o None si no existe
 
         Ejemplo:
-            producto = repo.buscar_por_sku("RON001")
+            producto = await repo.buscar_por_sku("RON001")
             if producto:
                 print("SKU ya existe")
         """
         pass
 
     @abstractmethod
-    def listar_todos(self) -> List[Producto]:
+    async def existe_sku(self, sku: str) -> bool:
+        """
+        Indica si ya existe un producto con el SKU dado.
+
+        IMPORTANCIA:
+        - Valida RN1 (SKU único) sin materializar el producto
+        - Preferible a buscar_por_sku cuando solo importa la existencia
+
+        Args:
+            sku: Código SKU del producto
+
+        Returns:
+            True si el SKU ya está registrado
+
+        Ejemplo:
+            if await repo.existe_sku("RON001"):
+                print("SKU ya existe")
+        """
+        pass
+
+    @abstractmethod
+    async def listar_todos(self) -> Sequence[Producto]:
         """
         Lista todos los productos del inventario (RF3).
 
         RESPONSABILIDAD:
         - Retornar todos los productos (activos e inactivos)
-        - til para consultas generales de inventario
+        - Útil para consultas generales de inventario
+
+        INMUTABILIDAD:
+        - Las implementaciones retornan una tupla
+        - Un mismo resultado puede compartirse (p. ej. en caché)
+          entre requests sin copias defensivas
 
         Returns:
-            Lista de todos los productos
+            Secuencia de solo lectura con todos los productos
 
         Ejemplo:
-            productos = repo.listar_todos()
+            productos = await repo.listar_todos()
             for p in productos:
                 print(f"{p.sku}: {p.stock} unidades")
         """
         pass
 
     @abstractmethod
-    def listar_activos(self) -> List[Producto]:
+    async def listar_activos(self) -> Sequence[Producto]:
         """
         Lista solo los productos activos.
 
@@ -158,10 +209,73 @@ class ProductoRepoPort(ABC):
         - RN5: Solo productos activos pueden venderse
 
         Returns:
-            Lista de productos con estado "Activo"
+            Secuencia de solo lectura con los productos "Activo"
 
         Ejemplo:
-            productos_activos = repo.listar_activos()
+            productos_activos = await repo.listar_activos()
             # Solo productos que pueden venderse
         """
         pass
+
+    @abstractmethod
+    async def listar_por_estado(self, estado: str) -> Sequence[Producto]:
+        """
+        Lista los productos con un estado dado.
+
+        RESPONSABILIDAD:
+        - Filtrar en el almacenamiento, no en Python
+        - Evita cargar todo el inventario para descartar la mayoría
+
+        Args:
+            estado: Estado del producto ("Activo" o "Inactivo")
+
+        Returns:
+            Secuencia de solo lectura con los productos en ese estado
+
+        Ejemplo:
+            inactivos = await repo.listar_por_estado("Inactivo")
+        """
+        pass
+
+    @abstractmethod
+    async def listar_por_tipo(self, tipo_licor: str) -> Sequence[Producto]:
+        """
+        Lista los productos de un tipo de licor.
+
+        Args:
+            tipo_licor: Tipo de licor (Ron, Whisky, Vodka, etc.)
+
+        Returns:
+            Secuencia de solo lectura con los productos de ese tipo
+
+        Ejemplo:
+            rones = await repo.listar_por_tipo("Ron")
+        """
+        pass
+
+    @abstractmethod
+    async def listar_pagina(
+        self,
+        limit: int,
+        offset: int = 0,
+        estado: str | None = None
+    ) -> Sequence[Producto]:
+        """
+        Lista una página del inventario, ordenada por ID.
+
+        RESPONSABILIDAD:
+        - Paginar y filtrar en el almacenamiento, no en Python
+        - Memoria y serialización proporcionales a la página
+
+        Args:
+            limit: Cantidad máxima de productos
+            offset: Productos a saltar desde el inicio
+            estado: Filtrar por estado (opcional)
+
+        Returns:
+            Secuencia de solo lectura con los productos de la página
+
+        Ejemplo:
+            segunda_pagina = await repo.listar_pagina(limit=50, offset=50)
+        """
+        pass
@@ -1,44 +1,31 @@
-from fastapi import FastAPI, HTTPException
-from sqlmodel import SQLModel, Field, Session, create_engine, select
+from contextlib import asynccontextmanager
 
-app = FastAPI(title="Inventarios LicoCastillo")
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-# Base de datos SQLite
-sqlite_url = "sqlite:///inventarios.db"
-engine = create_engine(sqlite_url)
+from app.api.v1.productos_routes import inventario_router, router as productos_router
+from app.config.settings import get_settings
+from app.infrastructure.db.database import create_db_and_tables, get_engine
 
-# Modelo
-class Producto(SQLModel, table=True):
-    id: int | None = Field(default=None, primary_key=True)
-    sku: str = Field(index=True, unique=True)
-    nombre: str
-    precio_compra: float
-    precio_venta: float
-    stock: int
-    estado: str = "Activo"
 
-# Crear tablas
-@app.on_event("startup")
-def startup():
-    SQLModel.metadata.create_all(engine)
+# Ciclo de vida: crear tablas al iniciar (solo si auto_create_tables)
+# y cerrar el pool al apagar
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if get_settings().auto_create_tables:
+        await create_db_and_tables()
+    yield
+    await get_engine().dispose()
 
-# Endpoint para registrar producto
-@app.post("/api/v1/productos")
-def crear_producto(producto: Producto):
-    with Session(engine) as session:
-        # verificar SKU único
-        existente = session.exec(select(Producto).where(Producto.sku == producto.sku)).first()
-        if existente:
-            raise HTTPException(status_code=409, detail="SKU ya existe")
 
-        session.add(producto)
-        session.commit()
-        session.refresh(producto)
-        return producto
-from typing import List
+app = FastAPI(
+    title="Inventarios LicoCastillo",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
-@app.get("/api/v1/inventario", response_model=List[Producto])
-def listar_productos():
-    with Session(engine) as session:
-        productos = session.exec(select(Producto)).all()
-        return productos
+# Todos los endpoints de productos pasan por los casos de uso y el
+# repositorio (tabla 'productos'): alta, alta masiva, dashboard,
+# actualización e inventario paginado
+app.include_router(productos_router)
+app.include_router(inventario_router)
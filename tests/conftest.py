@@ -0,0 +1,145 @@
+from datetime import datetime
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.v1.productos_routes import inventario_cache
+from app.domain.entities.producto import ESTADO_ACTIVO, Producto
+from app.domain.ports.producto_repo_port import ProductoRepoPort
+from app.infrastructure.db.database import get_session
+from app.main import app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def session():
+    """Sesión sobre una base SQLite en memoria, nueva para cada test."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    fabrica = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with fabrica() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def cliente(session):
+    """Cliente HTTP de la app, con get_session apuntando a la base en memoria."""
+    async def _get_session():
+        yield session
+
+    app.dependency_overrides[get_session] = _get_session
+    inventario_cache.clear()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as cliente:
+        yield cliente
+    app.dependency_overrides.clear()
+
+
+def _datos_producto(sku: str = "RON001", **campos) -> dict:
+    datos = {
+        "sku": sku,
+        "nombre": "Ron Viejo de Caldas",
+        "tipo_licor": "Ron",
+        "presentacion": "Botella 750ml",
+        "proveedor": "Licores Nacionales",
+        "precio_compra": 45000,
+        "precio_venta": 65000,
+        "stock": 100,
+    }
+    datos.update(campos)
+    return datos
+
+
+@pytest.fixture
+def datos_producto():
+    """Fábrica de datos de alta válidos (cuerpo JSON o kwargs del caso de uso)."""
+    return _datos_producto
+
+
+def _crear_producto(sku: str = "RON001", **campos) -> Producto:
+    return Producto(**_datos_producto(sku, **campos))
+
+
+@pytest.fixture
+def crear_producto():
+    """Fábrica de entidades Producto válidas; los campos indicados reemplazan los valores por defecto."""
+    return _crear_producto
+
+
+class RepoEnMemoria(ProductoRepoPort):
+    """
+    Implementación de ProductoRepoPort en memoria para probar casos de uso.
+
+    Registra las llamadas que interesan a los tests: `actualizados`
+    (productos pasados a actualizar) y `consultas` (listados pedidos).
+    """
+
+    def __init__(self, productos=()):
+        self.productos = {}
+        self.actualizados = []
+        self.consultas = 0
+        for producto in productos:
+            self._asignar_id(producto)
+
+    def _asignar_id(self, producto: Producto) -> Producto:
+        producto.id = len(self.productos) + 1
+        self.productos[producto.id] = producto
+        return producto
+
+    async def guardar(self, producto):
+        return self._asignar_id(producto)
+
+    async def guardar_muchos(self, productos):
+        return tuple(self._asignar_id(producto) for producto in productos)
+
+    async def actualizar(self, producto):
+        self.actualizados.append(producto)
+        return producto
+
+    async def buscar_por_id(self, id):
+        return self.productos.get(id)
+
+    async def buscar_por_sku(self, sku):
+        return next((p for p in self.productos.values() if p.sku == sku), None)
+
+    async def existe_sku(self, sku):
+        return await self.buscar_por_sku(sku) is not None
+
+    async def listar_todos(self):
+        self.consultas += 1
+        return tuple(self.productos.values())
+
+    async def listar_activos(self):
+        return await self.listar_por_estado(ESTADO_ACTIVO)
+
+    async def listar_por_estado(self, estado):
+        self.consultas += 1
+        return tuple(p for p in self.productos.values() if p.estado == estado)
+
+    async def listar_por_tipo(self, tipo_licor):
+        self.consultas += 1
+        return tuple(p for p in self.productos.values() if p.tipo_licor == tipo_licor)
+
+    async def listar_pagina(self, limit, offset=0, estado=None):
+        self.consultas += 1
+        productos = [p for p in self.productos.values() if estado is None or p.estado == estado]
+        return tuple(productos[offset:offset + limit])
+
+
+@pytest.fixture
+def repo(crear_producto):
+    """Repositorio en memoria con dos productos (IDs 1 y 2), el segundo inactivo."""
+    fecha = datetime(2025, 10, 30, 10, 0)
+    return RepoEnMemoria([
+        crear_producto("RON001", fecha_creacion=fecha, fecha_actualizacion=fecha),
+        crear_producto("WH001", estado="Inactivo", fecha_creacion=fecha, fecha_actualizacion=fecha),
+    ])
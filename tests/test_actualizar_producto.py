@@ -0,0 +1,93 @@
+import pytest
+
+from app.application.use_cases.actualizar_producto import ActualizarProductoUseCase
+from app.domain.entities.producto import Producto
+from app.domain.exceptions import ProductoNoEncontradoError
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_actualizacion_sin_cambios_no_escribe(repo):
+    producto = await repo.buscar_por_id(1)
+    fecha = producto.fecha_actualizacion
+    caso_uso = ActualizarProductoUseCase(repo)
+
+    resultado = await caso_uso.ejecutar(
+        1, nombre=producto.nombre, stock=producto.stock, estado=producto.estado
+    )
+
+    assert resultado is producto
+    assert repo.actualizados == []
+    assert producto.fecha_actualizacion == fecha
+    assert not caso_uso.persistio
+
+
+async def test_stock_negativo_lanza_error(repo):
+    with pytest.raises(ValueError, match="RN2"):
+        await ActualizarProductoUseCase(repo).ejecutar(1, stock=-1)
+
+    assert repo.actualizados == []
+
+
+async def test_producto_inexistente_lanza_error(repo):
+    with pytest.raises(ProductoNoEncontradoError):
+        await ActualizarProductoUseCase(repo).ejecutar(99, stock=10)
+
+
+async def test_cambio_de_campo_simple_actualiza_la_fecha(repo):
+    producto = await repo.buscar_por_id(1)
+    fecha = producto.fecha_actualizacion
+
+    caso_uso = ActualizarProductoUseCase(repo)
+
+    await caso_uso.ejecutar(1, nombre="Ron Añejo")
+
+    assert caso_uso.persistio
+    assert repo.actualizados == [producto]
+    assert producto.nombre == "Ron Añejo"
+    assert producto.fecha_actualizacion > fecha
+
+
+async def test_cambio_de_estado(repo):
+    producto = await ActualizarProductoUseCase(repo).ejecutar(2, estado="Activo")
+
+    assert producto.esta_activo()
+    assert repo.actualizados == [producto]
+
+
+@pytest.fixture
+def validaciones_de_precio(monkeypatch):
+    """Cuenta las llamadas a Producto.validar_precios."""
+    llamadas = []
+    original = Producto.validar_precios
+
+    def espia(self):
+        llamadas.append(self)
+        original(self)
+
+    monkeypatch.setattr(Producto, "validar_precios", espia)
+    return llamadas
+
+
+async def test_precios_sin_cambio_no_se_revalidan(repo, validaciones_de_precio):
+    producto = await repo.buscar_por_id(1)
+
+    await ActualizarProductoUseCase(repo).ejecutar(
+        1, stock=5, precio_venta=producto.precio_venta
+    )
+
+    assert validaciones_de_precio == []
+    assert repo.actualizados == [producto]
+
+
+async def test_cambio_de_precio_se_revalida(repo, validaciones_de_precio):
+    await ActualizarProductoUseCase(repo).ejecutar(1, precio_venta=70000)
+
+    assert len(validaciones_de_precio) == 1
+
+
+async def test_precio_invalido_lanza_error(repo):
+    with pytest.raises(ValueError, match="precio de compra"):
+        await ActualizarProductoUseCase(repo).ejecutar(1, precio_compra=-1)
+
+    assert repo.actualizados == []
@@ -0,0 +1,64 @@
+import pytest
+from cachetools import TTLCache
+
+from app.application.use_cases.consultar_inventario import ConsultarInventarioUseCase
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_retorna_tuplas(repo):
+    caso_uso = ConsultarInventarioUseCase(repo)
+
+    assert isinstance(await caso_uso.ejecutar(), tuple)
+    assert isinstance(await caso_uso.ejecutar(solo_activos=True), tuple)
+    assert isinstance(await caso_uso.listar_pagina(limit=10), tuple)
+
+
+async def test_sin_cache_consulta_siempre_el_repositorio(repo):
+    caso_uso = ConsultarInventarioUseCase(repo)
+
+    await caso_uso.ejecutar()
+    await caso_uso.ejecutar()
+
+    assert repo.consultas == 2
+
+
+async def test_segunda_consulta_sale_de_la_cache(repo):
+    caso_uso = ConsultarInventarioUseCase(repo, TTLCache(maxsize=8, ttl=60))
+
+    primera = await caso_uso.ejecutar()
+    segunda = await caso_uso.ejecutar()
+
+    assert segunda is primera
+    assert repo.consultas == 1
+
+
+async def test_cache_indexada_por_solo_activos(repo):
+    cache = {}
+    caso_uso = ConsultarInventarioUseCase(repo, cache)
+
+    todos = await caso_uso.ejecutar(solo_activos=False)
+    activos = await caso_uso.ejecutar(solo_activos=True)
+
+    assert [p.sku for p in todos] == ["RON001", "WH001"]
+    assert [p.sku for p in activos] == ["RON001"]
+    assert cache == {False: todos, True: activos}
+    assert repo.consultas == 2
+
+    assert await caso_uso.ejecutar(solo_activos=True) is activos
+    assert repo.consultas == 2
+
+
+async def test_pagina_cacheada_por_limit_offset_y_estado(repo):
+    cache = {}
+    caso_uso = ConsultarInventarioUseCase(repo, cache)
+
+    pagina = await caso_uso.listar_pagina(limit=1, offset=1)
+    inactivos = await caso_uso.listar_pagina(limit=10, estado="Inactivo")
+
+    assert [p.sku for p in pagina] == ["WH001"]
+    assert [p.sku for p in inactivos] == ["WH001"]
+    assert set(cache) == {(1, 1, None), (10, 0, "Inactivo")}
+
+    assert await caso_uso.listar_pagina(limit=1, offset=1) is pagina
+    assert repo.consultas == 2
@@ -0,0 +1,35 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+MODULOS_APP = sorted(
+    ".".join(ruta.relative_to(RAIZ).with_suffix("").parts)
+    for ruta in (RAIZ / "app").rglob("*.py")
+)
+
+
+@pytest.mark.parametrize("modulo", MODULOS_APP)
+def test_modulo_importa(modulo):
+    importlib.import_module(modulo)
+
+
+def test_importa_la_app():
+    from app.main import app
+
+    assert app.title == "Inventarios LicoCastillo"
+
+
+def test_importar_la_app_no_lee_la_configuracion():
+    # En un proceso nuevo: la configuración y el engine se crean en el primer uso
+    codigo = (
+        "import app.main\n"
+        "from app.config.settings import get_settings\n"
+        "from app.infrastructure.db.database import get_engine\n"
+        "assert get_settings.cache_info().currsize == 0\n"
+        "assert get_engine.cache_info().currsize == 0\n"
+    )
+    subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True)
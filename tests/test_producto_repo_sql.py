@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import sqlite
+
+from app.infrastructure.db.models import ProductoModel
+from app.infrastructure.repositories.producto_repo_sql import (
+    TAMANO_LOTE,
+    ProductoRepoSQL,
+    _MAX_VARIABLES_SQLITE,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_insert_por_bloque_cabe_en_el_limite_de_variables(crear_producto):
+    fila = ProductoRepoSQL(None)._to_model(crear_producto()).model_dump()
+    statement = insert(ProductoModel).values([fila] * TAMANO_LOTE)
+
+    parametros = statement.compile(dialect=sqlite.dialect()).params
+
+    assert len(parametros) <= _MAX_VARIABLES_SQLITE
+
+
+async def test_guardar_muchos_asigna_ids_en_el_orden_del_lote(session, crear_producto):
+    repo = ProductoRepoSQL(session)
+    skus = ["WH001", "RON001", "VOD001"]
+
+    guardados = await repo.guardar_muchos([crear_producto(sku) for sku in skus])
+
+    assert isinstance(guardados, tuple)
+    assert [p.sku for p in guardados] == skus
+    assert all(p.id is not None for p in guardados)
+    for producto in guardados:
+        assert (await repo.buscar_por_id(producto.id)).sku == producto.sku
+
+
+async def test_guardar_muchos_inserta_varios_bloques(session, crear_producto):
+    repo = ProductoRepoSQL(session)
+    skus = [f"SKU{i:04d}" for i in range(TAMANO_LOTE + 3)]
+
+    guardados = await repo.guardar_muchos([crear_producto(sku) for sku in skus])
+
+    assert [p.sku for p in guardados] == skus
+    assert len({p.id for p in guardados}) == len(skus)
+    assert len(await repo.listar_todos()) == len(skus)
+
+
+async def test_guardar_muchos_lote_vacio(session):
+    assert await ProductoRepoSQL(session).guardar_muchos([]) == ()
+
+
+async def test_guardar_muchos_rechaza_skus_repetidos_en_el_lote(session, crear_producto):
+    repo = ProductoRepoSQL(session)
+
+    with pytest.raises(ValueError, match="RN1"):
+        await repo.guardar_muchos([crear_producto("RON001"), crear_producto("RON001")])
+
+    assert await repo.listar_todos() == ()
+
+
+async def test_guardar_muchos_rechaza_skus_existentes(session, crear_producto):
+    repo = ProductoRepoSQL(session)
+    await repo.guardar(crear_producto("RON001"))
+
+    with pytest.raises(ValueError, match="RON001"):
+        await repo.guardar_muchos([crear_producto("WH001"), crear_producto("RON001")])
+
+    assert [p.sku for p in await repo.listar_todos()] == ["RON001"]
@@ -0,0 +1,186 @@
+import anyio
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_producto_repo
+from app.api.v1.productos_routes import inventario_cache
+from app.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def cliente_lento(repo):
+    """
+    Cliente sobre el repositorio en memoria, cuyo listar_todos (dashboard)
+    queda bloqueado hasta que el test hace repo.liberar.set().
+    """
+    listar_todos = repo.listar_todos
+    repo.liberar = anyio.Event()
+
+    async def listar_todos_lento():
+        await repo.liberar.wait()
+        return await listar_todos()
+
+    repo.listar_todos = listar_todos_lento
+    app.dependency_overrides[get_producto_repo] = lambda: repo
+    inventario_cache.clear()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as cliente:
+        yield cliente
+    app.dependency_overrides.clear()
+
+
+async def test_alta_visible_en_dashboard_inventario_y_actualizable(cliente, datos_producto):
+    respuesta = await cliente.post("/api/v1/productos", json=datos_producto("ron001"))
+
+    assert respuesta.status_code == 200
+    producto = respuesta.json()
+    assert producto["sku"] == "RON001"
+    assert producto["estado"] == "Activo"
+
+    dashboard = (await cliente.get("/api/v1/productos")).json()
+    assert [p["id"] for p in dashboard] == [producto["id"]]
+    inventario = (await cliente.get("/api/v1/inventario")).json()
+    assert [p["id"] for p in inventario] == [producto["id"]]
+
+    respuesta = await cliente.patch(f"/api/v1/productos/{producto['id']}", json={"stock": 7})
+    assert respuesta.status_code == 200
+    assert respuesta.json()["stock"] == 7
+
+
+async def test_alta_con_sku_existente_responde_409(cliente, datos_producto):
+    await cliente.post("/api/v1/productos", json=datos_producto("RON001"))
+
+    respuesta = await cliente.post("/api/v1/productos", json=datos_producto("RON001"))
+
+    assert respuesta.status_code == 409
+    assert "RN1" in respuesta.json()["detail"]
+
+
+async def test_bulk_registra_el_lote_en_orden(cliente, datos_producto):
+    respuesta = await cliente.post(
+        "/api/v1/productos/bulk",
+        json=[datos_producto("wh001"), datos_producto("RON001"), datos_producto("VOD001")]
+    )
+
+    assert respuesta.status_code == 200
+    guardados = respuesta.json()
+    assert [p["sku"] for p in guardados] == ["WH001", "RON001", "VOD001"]
+    assert all(p["id"] is not None and p["estado"] == "Activo" for p in guardados)
+
+
+async def test_bulk_invalida_la_cache_del_inventario(cliente, datos_producto):
+    assert (await cliente.get("/api/v1/productos")).json() == []
+
+    await cliente.post("/api/v1/productos/bulk", json=[datos_producto("RON001")])
+
+    assert [p["sku"] for p in (await cliente.get("/api/v1/productos")).json()] == ["RON001"]
+
+
+async def test_bulk_rechaza_sku_existente_sin_guardar_nada(cliente, datos_producto):
+    await cliente.post("/api/v1/productos/bulk", json=[datos_producto("RON001")])
+
+    respuesta = await cliente.post(
+        "/api/v1/productos/bulk",
+        json=[datos_producto("WH001"), datos_producto("RON001")]
+    )
+
+    assert respuesta.status_code == 409
+    assert [p["sku"] for p in (await cliente.get("/api/v1/productos")).json()] == ["RON001"]
+
+
+async def test_bulk_rechaza_skus_repetidos_en_el_lote(cliente, datos_producto):
+    respuesta = await cliente.post(
+        "/api/v1/productos/bulk",
+        json=[datos_producto("ron001"), datos_producto("RON001")]
+    )
+
+    assert respuesta.status_code == 409
+
+
+async def test_bulk_valida_cada_producto(cliente, datos_producto):
+    respuesta = await cliente.post(
+        "/api/v1/productos/bulk",
+        json=[datos_producto("RON001"), {**datos_producto("WH001"), "stock": -1}]
+    )
+
+    assert respuesta.status_code == 422
+
+
+
+async def test_patch_responde_el_producto_completo(cliente, datos_producto):
+    alta = await cliente.post("/api/v1/productos", json=datos_producto())
+    id = alta.json()["id"]
+
+    respuesta = await cliente.patch(f"/api/v1/productos/{id}", json={"stock": 7})
+
+    assert respuesta.status_code == 200
+    producto = respuesta.json()
+    assert producto["stock"] == 7
+    assert producto["nombre"] == "Ron Viejo de Caldas"
+    assert len(producto) == 12
+
+
+async def test_patch_de_producto_inexistente_responde_404(cliente):
+    respuesta = await cliente.patch("/api/v1/productos/99", json={"stock": 7})
+
+    assert respuesta.status_code == 404
+
+
+async def test_inventario_filtra_por_estado(cliente, datos_producto):
+    await cliente.post("/api/v1/productos/bulk", json=[datos_producto("RON001"), datos_producto("WH001")])
+    await cliente.patch("/api/v1/productos/2", json={"estado": "Inactivo"})
+
+    inactivos = (await cliente.get("/api/v1/inventario", params={"estado": "Inactivo"})).json()
+
+    assert [p["sku"] for p in inactivos] == ["WH001"]
+
+
+async def test_inventario_rechaza_estado_desconocido(cliente):
+    respuesta = await cliente.get("/api/v1/inventario", params={"estado": "Borrado"})
+
+    assert respuesta.status_code == 422
+
+
+async def test_patch_sin_cambios_no_invalida_la_cache(cliente, datos_producto):
+    alta = (await cliente.post("/api/v1/productos", json=datos_producto(stock=5))).json()
+    await cliente.get("/api/v1/productos")
+    assert len(inventario_cache) == 1
+
+    respuesta = await cliente.patch(f"/api/v1/productos/{alta['id']}", json={"stock": 5})
+
+    assert respuesta.status_code == 200
+    assert len(inventario_cache) == 1
+
+    await cliente.patch(f"/api/v1/productos/{alta['id']}", json={"stock": 6})
+
+    assert len(inventario_cache) == 0
+
+
+async def test_consulta_cacheada_no_espera_a_una_consulta_lenta(cliente_lento, repo):
+    await cliente_lento.get("/api/v1/inventario")
+
+    async with anyio.create_task_group() as tareas:
+        tareas.start_soon(cliente_lento.get, "/api/v1/productos")
+        await anyio.sleep(0.01)
+
+        with anyio.fail_after(1):
+            respuesta = await cliente_lento.get("/api/v1/inventario")
+        assert respuesta.status_code == 200
+
+        repo.liberar.set()
+
+
+async def test_consulta_iniciada_antes_de_una_escritura_no_se_cachea(cliente_lento, repo):
+    async with anyio.create_task_group() as tareas:
+        tareas.start_soon(cliente_lento.get, "/api/v1/productos")
+        await anyio.sleep(0.01)
+
+        await cliente_lento.patch("/api/v1/productos/1", json={"stock": 1})
+        repo.liberar.set()
+
+    assert False not in inventario_cache
+
+    await cliente_lento.get("/api/v1/productos")
+
+    assert False in inventario_cache
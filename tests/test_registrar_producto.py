@@ -0,0 +1,37 @@
+import pytest
+
+from app.application.use_cases.registrar_producto import RegistrarProductoUseCase
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_registrar_asigna_id_y_estado_activo(repo, datos_producto):
+    producto = await RegistrarProductoUseCase(repo).ejecutar(**datos_producto("VOD001"))
+
+    assert producto.id == 3
+    assert producto.esta_activo()
+    assert await repo.buscar_por_id(3) is producto
+
+
+async def test_registrar_rechaza_precio_invalido(repo, datos_producto):
+    with pytest.raises(ValueError, match="precio de venta"):
+        await RegistrarProductoUseCase(repo).ejecutar(**{**datos_producto("VOD001"), "precio_venta": 0})
+
+    assert len(repo.productos) == 2
+
+
+async def test_registrar_muchos_valida_todo_el_lote_antes_de_guardar(repo, datos_producto):
+    with pytest.raises(ValueError, match="RN2"):
+        await RegistrarProductoUseCase(repo).ejecutar_muchos(
+            [datos_producto("VOD001"), {**datos_producto("GIN001"), "stock": -1}]
+        )
+
+    assert len(repo.productos) == 2
+
+
+async def test_registrar_muchos_retorna_en_orden(repo, datos_producto):
+    guardados = await RegistrarProductoUseCase(repo).ejecutar_muchos(
+        [datos_producto("VOD001"), datos_producto("GIN001")]
+    )
+
+    assert [(p.id, p.sku) for p in guardados] == [(3, "VOD001"), (4, "GIN001")]